@@ -1,17 +1,54 @@
 """Gagiteck Python SDK - AI SaaS Platform Client Library."""
 
-from gagiteck.client import Client
-from gagiteck.agent import Agent
+from typing import TYPE_CHECKING, Any
+import importlib
+
+from gagiteck.exceptions import GagiteckError, APIError, AuthenticationError, RateLimitError
+
+# Imported eagerly: it is lightweight, and importing the submodule later
+# would shadow the ``tool`` decorator with the ``gagiteck.tool`` module.
 from gagiteck.tool import Tool, tool
-from gagiteck.exceptions import GagiteckError, APIError, AuthenticationError
+
+if TYPE_CHECKING:
+    from gagiteck.client import Client, AsyncClient
+    from gagiteck.agent import Agent
+    from gagiteck.batch import BatchCoalescer, BatchProcessor
 
 __version__ = "0.1.0"
 __all__ = [
     "Client",
+    "AsyncClient",
     "Agent",
+    "BatchProcessor",
+    "BatchCoalescer",
     "Tool",
     "tool",
     "GagiteckError",
     "APIError",
     "AuthenticationError",
+    "RateLimitError",
 ]
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# ``import gagiteck`` stays cheap and httpx is only loaded when a client
+# is actually used.
+_LAZY_ATTRS = {
+    "Client": "gagiteck.client",
+    "AsyncClient": "gagiteck.client",
+    "Agent": "gagiteck.agent",
+    "BatchProcessor": "gagiteck.batch",
+    "BatchCoalescer": "gagiteck.batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
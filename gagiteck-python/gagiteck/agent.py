@@ -1,12 +1,16 @@
 """Agent class for local agent creation and execution."""
 
-from typing import Any, Callable, Optional
+from collections import deque
+import inspect
+from itertools import islice
+from typing import Any, Callable, Literal, Optional
 from dataclasses import dataclass, field
 
+from gagiteck.batch import BatchProcessor
 from gagiteck.tool import Tool
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Create and run AI agents locally.
 
@@ -16,6 +20,13 @@ class Agent:
         system_prompt: System prompt for the agent
         tools: List of tools the agent can use
         memory_enabled: Enable conversation memory
+        memory_window: Number of recent user/assistant turn pairs to remember
+        memory_mode: How memory is bounded: "buffer" keeps every turn,
+            "window" keeps the last ``memory_window`` turn pairs, and
+            "summary" additionally folds older turns into a running summary
+        summary_threshold: History length (in messages) that triggers
+            summarization in "summary" mode; must be at least
+            ``4 * memory_window`` so rollovers stay infrequent
         max_tokens: Maximum tokens in response
 
     Example:
@@ -41,19 +52,39 @@ class Agent:
     memory_enabled: bool = False
     max_tokens: int = 4096
     temperature: float = 0.7
+    memory_window: int = 10
+    memory_mode: Literal["buffer", "window", "summary"] = "window"
+    summary_threshold: int = 40
 
-    _conversation_history: list[dict] = field(default_factory=list, repr=False)
+    _conversation_history: deque[dict] = field(init=False, repr=False)
+    _summary: str = field(default="", init=False, repr=False)
     _client: Any = field(default=None, repr=False)
 
     def __post_init__(self):
         # Convert callable tools to Tool objects
-        processed_tools = []
-        for t in self.tools:
-            if callable(t) and not isinstance(t, Tool):
-                processed_tools.append(Tool.from_function(t))
-            else:
-                processed_tools.append(t)
-        self.tools = processed_tools
+        self.tools = [_as_tool(t) for t in self.tools]
+
+        if self.memory_mode not in ("buffer", "window", "summary"):
+            raise ValueError(f"Unknown memory_mode: {self.memory_mode!r}")
+
+        if self.memory_window < 1:
+            raise ValueError("memory_window must be at least 1")
+
+        if self.memory_mode == "summary" and self.summary_threshold < 4 * self.memory_window:
+            # Otherwise the kept tail sits just under the threshold and every
+            # turn triggers another summarize call
+            raise ValueError("summary_threshold must be at least 4 * memory_window")
+
+        if self._client is not None and inspect.iscoroutinefunction(
+            getattr(getattr(self._client, "agents", None), "summarize", None)
+        ):
+            # Agent.run is synchronous, so summaries need a sync Client
+            raise TypeError("Agent requires a synchronous Client, not an AsyncClient")
+
+        # In "window" mode the oldest turns are evicted automatically; the
+        # other modes keep everything and "summary" trims it on rollover
+        maxlen = 2 * self.memory_window if self.memory_mode == "window" else None
+        self._conversation_history = deque(maxlen=maxlen)
 
     def run(self, message: str, context: Optional[dict] = None) -> "AgentResponse":
         """Run the agent with a message.
@@ -65,15 +96,65 @@ class Agent:
         Returns:
             AgentResponse with the result
         """
-        # Add to conversation history
-        self._conversation_history.append({"role": "user", "content": message})
+        self._build_request(message)
+
+        # For now, return a placeholder response
+        # In production, this would send the request to the API or local model
+        response = AgentResponse(
+            content=f"[Agent '{self.name}' would process: {message}]",
+            model=self.model,
+            tool_calls=[],
+        )
+
+        if self.memory_enabled:
+            # Record the turn only once it has completed, so the window
+            # always holds whole user/assistant pairs
+            self._conversation_history.extend([
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": response.content},
+            ])
+
+        return response
+
+    def add_tool(self, tool: Tool | Callable) -> None:
+        """Add a tool (or a plain function) to the agent."""
+        self.tools.append(_as_tool(tool))
+
+    def run_batch(
+        self,
+        messages: list[str],
+        context: Optional[dict] = None,
+        max_concurrency: int = 10,
+    ) -> list["AgentResponse"]:
+        """Run the agent over many messages concurrently.
+
+        Args:
+            messages: The user messages to process
+            context: Optional context dictionary passed to every run
+            max_concurrency: Maximum concurrent runs (default: 10)
+
+        Returns:
+            List of AgentResponse, in the same order as ``messages``
+        """
+        if self.memory_enabled:
+            # Runs share conversation history, so keep them in order
+            max_concurrency = 1
+        processor = BatchProcessor(
+            lambda m: self.run(m, context),
+            max_concurrency=max_concurrency,
+        )
+        return processor.run(messages)
 
-        # Build the request
+    def clear_memory(self) -> None:
+        """Clear conversation history."""
+        self._conversation_history.clear()
+        self._summary = ""
+
+    def _build_request(self, message: str) -> dict:
+        """Build the request body for a run, omitting unset fields."""
         request = {
             "model": self.model,
-            "messages": self._conversation_history if self.memory_enabled else [
-                {"role": "user", "content": message}
-            ],
+            "messages": self._build_messages(message),
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
         }
@@ -82,30 +163,74 @@ class Agent:
             request["system"] = self.system_prompt
 
         if self.tools:
+            # Each Tool caches its own schema, so this only collects references
             request["tools"] = [t.to_dict() for t in self.tools]
 
-        # For now, return a placeholder response
-        # In production, this would call the API or local model
-        response = AgentResponse(
-            content=f"[Agent '{self.name}' would process: {message}]",
-            model=self.model,
-            tool_calls=[],
-        )
+        return request
 
-        if self.memory_enabled:
-            self._conversation_history.append({
-                "role": "assistant",
-                "content": response.content,
-            })
+    def _build_messages(self, message: str) -> list[dict]:
+        """Assemble the messages to send for a new user message.
 
-        return response
+        Messages are always ordered ``[*frozen_prefix, *history, message]``,
+        where the frozen prefix is the summary (if any). The prefix only
+        changes when the summary rolls over, so consecutive requests share a
+        common prefix and the provider's KV cache stays warm. (In "window"
+        mode the oldest turn is evicted once the window is full, so the
+        prefix shifts every turn; use "summary" mode for long chats.)
 
-    def clear_memory(self) -> None:
-        """Clear conversation history."""
-        self._conversation_history = []
+        The message itself is not recorded here; :meth:`run` adds the
+        completed turn to the history.
+        """
+        user_message = {"role": "user", "content": message}
+        if not self.memory_enabled:
+            return [user_message]
+
+        if self.memory_mode == "summary":
+            self._maybe_summarize()
 
+        prefix = []
+        if self._summary:
+            prefix.append({"role": "system", "content": f"Summary: {self._summary}"})
+        return [*prefix, *self._conversation_history, user_message]
 
-@dataclass
+    def _maybe_summarize(self) -> None:
+        """Fold all but the last ``memory_window`` turns into the summary.
+
+        This only happens once the history exceeds ``summary_threshold``, so
+        the summary (and thus the start of the request) stays unchanged
+        between rollovers and provider-side prompt caching keeps hitting.
+        """
+        history = self._conversation_history
+        # The last ``memory_window`` user/assistant turn pairs
+        keep = 2 * self.memory_window
+        if len(history) <= self.summary_threshold or len(history) <= keep:
+            return
+
+        # Only drop the old turns once the summary has been produced, so a
+        # failed summarize call leaves the history intact
+        count = len(history) - keep
+        old = list(islice(history, count))
+        if self._client is not None:
+            result = self._client.agents.summarize(old, summary=self._summary or None)
+            summary = result["summary"]
+        else:
+            # Placeholder until local model execution is available
+            previous = f"{self._summary} " if self._summary else ""
+            summary = f"{previous}[{len(old)} earlier messages]"
+
+        for _ in range(count):
+            history.popleft()
+        self._summary = summary
+
+
+def _as_tool(t: Tool | Callable) -> Tool:
+    """Convert a plain callable into a Tool."""
+    if callable(t) and not isinstance(t, Tool):
+        return Tool.from_function(t)
+    return t
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """Response from an agent run."""
 
@@ -0,0 +1,252 @@
+"""Concurrent batch processing for agent runs."""
+
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, Optional, TypeVar
+import asyncio
+import inspect
+import threading
+import time
+
+T = TypeVar("T")
+
+
+class BatchProcessor:
+    """Run a function over many inputs concurrently.
+
+    Inputs are fanned out with ``asyncio.gather`` under a semaphore, so at
+    most ``max_concurrency`` calls are in flight at once. Results are
+    returned in input order. Coroutine functions are awaited directly;
+    plain functions run in worker threads, and any awaitable they return
+    (e.g. from a lambda wrapping an ``AsyncClient`` call) is awaited.
+
+    Args:
+        func: Function (sync or async) called once per input
+        max_concurrency: Maximum concurrent calls (default: 10)
+        rate_limit: Optional maximum calls started per second
+
+    Example:
+        >>> from gagiteck import Client
+        >>> from gagiteck.batch import BatchProcessor
+        >>> client = Client(api_key="ggt_your_key_here")
+        >>> processor = BatchProcessor(
+        ...     lambda m: client.agents.run("agent_123", m),
+        ...     max_concurrency=5,
+        ... )
+        >>> results = processor.run(["Hello", "Summarize this", "Translate that"])
+    """
+
+    def __init__(
+        self,
+        func: Callable[[Any], Any],
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+
+        self.func = func
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+
+    async def run_batch(self, inputs: Iterable[Any]) -> list[Any]:
+        """Process all inputs concurrently and return results in order."""
+        sem = asyncio.Semaphore(self.max_concurrency)
+        bucket = _TokenBucket(self.rate_limit) if self.rate_limit else None
+        return await asyncio.gather(*[self._one(sem, bucket, i) for i in inputs])
+
+    def run(self, inputs: Iterable[Any]) -> list[Any]:
+        """Synchronous wrapper around :meth:`run_batch`."""
+        return run_sync(self.run_batch(inputs))
+
+    async def _one(
+        self,
+        sem: asyncio.Semaphore,
+        bucket: Optional["_TokenBucket"],
+        item: Any,
+    ) -> Any:
+        async with sem:
+            if bucket is not None:
+                await bucket.acquire()
+            if inspect.iscoroutinefunction(self.func):
+                return await self.func(item)
+            result = await asyncio.to_thread(self.func, item)
+            # Sync callables may still return an awaitable (e.g. a lambda
+            # wrapping an AsyncClient call); await it on this loop
+            if inspect.isawaitable(result):
+                return await result
+            return result
+
+
+class BatchCoalescer:
+    """Coalesce concurrent submissions into batched calls.
+
+    Payloads submitted from many coroutines are buffered, and the buffer is
+    flushed through ``send`` once ``max_batch`` payloads are waiting or
+    ``max_wait_ms`` has passed since the first one arrived. Each caller
+    gets back the result at its own position in the batch.
+
+    Args:
+        send: Coroutine function taking a list of payloads and returning a
+            list of results in the same order
+        max_batch: Maximum payloads per batch (default: 8)
+        max_wait_ms: Maximum time to wait for a batch to fill (default: 50)
+
+    Example:
+        >>> coalescer = BatchCoalescer(send_many, max_batch=8, max_wait_ms=50)
+        >>> result = await coalescer.submit({"message": "Hello"})
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[Any]], Awaitable[list[Any]]],
+        max_batch: int = 8,
+        max_wait_ms: float = 50,
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.send = send
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, payload: Any) -> Any:
+        """Queue a payload and wait for its result."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop collecting and send everything already submitted.
+
+        Payloads still waiting for a batch to fill are flushed immediately,
+        and this returns once every in-flight batch has completed.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            batch = []
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._start_flush(batch)
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[Any, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait_ms / 1000
+                while len(batch) < self.max_batch:
+                    # Take whatever is already queued before checking the deadline
+                    try:
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Flush in the background so the next batch can start filling
+                self._start_flush(batch)
+                batch = []
+        finally:
+            # Cancelled by close() while filling: don't strand these callers
+            if batch:
+                self._start_flush(batch)
+
+    def _start_flush(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.send([payload for payload, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch returned {len(results)} results for {len(batch)} payloads"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class _TokenBucket:
+    """Token bucket limiting how many calls start per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` when no event loop is running. Inside a running
+    loop (e.g. Jupyter), the coroutine runs on a fresh loop in a helper
+    thread instead of raising ``RuntimeError``.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result: list[Any] = []
+    error: list[BaseException] = []
+
+    def target() -> None:
+        try:
+            result.append(asyncio.run(coro))
+        except BaseException as e:
+            error.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if error:
+        raise error[0]
+    return result[0]
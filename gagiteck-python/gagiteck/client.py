@@ -1,9 +1,66 @@
 """Gagiteck API Client."""
 
-from typing import Optional
+from __future__ import annotations
+
+import asyncio
+import http.cookiejar
+import importlib.util
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 import httpx
 
-from gagiteck.exceptions import AuthenticationError, APIError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+from gagiteck.batch import BatchCoalescer, BatchProcessor
+from gagiteck.exceptions import AuthenticationError, APIError, GagiteckError, RateLimitError
+
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/2 needs the optional ``h2`` package (``pip install gagiteck[http2]``).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_NDJSON_HEADERS = {"Accept": "application/x-ndjson"}
+
+_API_KEY_RE = re.compile(r"ggt_[A-Za-z0-9_]{8,}")
+
+
+class _PoolEntry:
+    """A shared httpx.Client and the number of Client instances using it."""
+
+    __slots__ = ("http_client", "refs")
+
+    def __init__(self, http_client: httpx.Client):
+        self.http_client = http_client
+        self.refs = 0
+
+
+class _RejectCookies(http.cookiejar.DefaultCookiePolicy):
+    """Cookie policy that never stores cookies.
+
+    Pooled HTTP clients are shared between API keys, so any persisted
+    cookie would be sent on behalf of other tenants.
+    """
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: Any) -> bool:
+        return False
+
+
+# Sync httpx clients shared between Client instances with the same
+# connection settings, keyed by those settings.
+_POOL: dict[tuple, _PoolEntry] = {}
+_POOL_LOCK = threading.Lock()
 
 
 class Client:
@@ -14,6 +71,12 @@ class Client:
         base_url: API base URL (default: https://api.gagiteck.com/v1)
         timeout: Request timeout in seconds (default: 30)
         debug: Enable debug logging (default: False)
+        pool_limits: Connection pool limits (default: DEFAULT_POOL_LIMITS)
+        http2: Use HTTP/2 (default: enabled when ``h2`` is installed)
+        max_retries: Retries on HTTP 429 before raising RateLimitError (default: 3)
+
+    Clients with the same base URL, timeout and connection settings share
+    one underlying connection pool, even when their API keys differ.
 
     Example:
         >>> from gagiteck import Client
@@ -29,27 +92,46 @@ class Client:
         base_url: Optional[str] = None,
         timeout: int = 30,
         debug: bool = False,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        max_retries: int = 3,
     ):
-        if not api_key:
-            raise AuthenticationError("API key is required")
-
-        if not api_key.startswith("ggt_"):
-            raise AuthenticationError("Invalid API key format. Key should start with 'ggt_'")
+        _validate_api_key(api_key)
 
         self.api_key = api_key
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
         self.debug = debug
-
-        self._http_client = httpx.Client(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": f"gagiteck-python/0.1.0",
-            },
-            timeout=timeout,
+        self.pool_limits = pool_limits or DEFAULT_POOL_LIMITS
+        self.http2 = _HTTP2_AVAILABLE if http2 is None else http2
+        self.max_retries = max_retries
+
+        # Sent per request, since the underlying HTTP client may be shared
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._pool_key = (
+            self.base_url,
+            timeout,
+            self.http2,
+            self.pool_limits.max_connections,
+            self.pool_limits.max_keepalive_connections,
+            self.pool_limits.keepalive_expiry,
         )
+        self._pool_entry: Optional[_PoolEntry] = _acquire_http_client(
+            self._pool_key,
+            lambda: httpx.Client(
+                base_url=self.base_url,
+                headers={
+                    "Content-Type": "application/json",
+                    "User-Agent": f"gagiteck-python/0.1.0",
+                },
+                # Shared across tenants, so the client must stay stateless
+                cookies=http.cookiejar.CookieJar(policy=_RejectCookies()),
+                timeout=timeout,
+                limits=self.pool_limits,
+                http2=self.http2,
+            ),
+        )
+        self._http_client: Optional[httpx.Client] = self._pool_entry.http_client
 
         # Initialize API resources
         self.agents = AgentsAPI(self)
@@ -63,29 +145,68 @@ class Client:
         json: Optional[dict] = None,
         params: Optional[dict] = None,
     ) -> dict:
-        """Make an HTTP request to the API."""
+        """Make an HTTP request to the API, retrying when rate limited."""
+        self._check_open()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._http_client.request(
+                    method=method,
+                    url=path,
+                    content=_dumps(json) if json is not None else None,
+                    params=params,
+                    headers=self._auth_headers,
+                )
+                response.raise_for_status()
+                return _loads(response.content)
+            except httpx.HTTPStatusError as e:
+                error = _api_error(e.response)
+                if not isinstance(error, RateLimitError) or attempt == self.max_retries:
+                    raise error
+            except httpx.RequestError as e:
+                raise APIError(code=0, message=str(e))
+            time.sleep(_retry_delay(error, attempt))
+
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Iterator[Any]:
+        """Stream an NDJSON response, yielding one decoded object per line.
+
+        Only the current line is held in memory, so large responses are
+        never buffered in full.
+        """
+        self._check_open()
         try:
-            response = self._http_client.request(
-                method=method,
-                url=path,
-                json=json,
+            with self._http_client.stream(
+                method,
+                path,
+                content=_dumps(json) if json is not None else None,
                 params=params,
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("Invalid or expired API key")
-            raise APIError(
-                code=e.response.status_code,
-                message=e.response.text,
-            )
+                headers={**self._auth_headers, **_NDJSON_HEADERS},
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    raise _api_error(response)
+                for line in response.iter_lines():
+                    if line:
+                        yield _loads(line)
         except httpx.RequestError as e:
             raise APIError(code=0, message=str(e))
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._http_client.close()
+        """Release the HTTP client, closing it once no other Client uses it."""
+        if self._pool_entry is not None:
+            _release_http_client(self._pool_key, self._pool_entry)
+            self._pool_entry = None
+            # The pooled client may live on for other Clients; drop our handle
+            self._http_client = None
+
+    def _check_open(self) -> None:
+        if self._http_client is None:
+            raise GagiteckError("Client is closed")
 
     def __enter__(self) -> "Client":
         return self
@@ -150,6 +271,37 @@ class AgentsAPI:
             data["context"] = context
         return self._client._request("POST", f"/agents/{agent_id}/run", json=data)
 
+    def summarize(self, messages: list[dict], summary: Optional[str] = None) -> dict:
+        """Summarize conversation messages, extending an existing summary."""
+        data = {"messages": messages}
+        if summary:
+            data["summary"] = summary
+        return self._client._request("POST", "/agents/summarize", json=data)
+
+    def batch_run(
+        self,
+        agent_id: str,
+        messages: list[str],
+        context: Optional[dict] = None,
+        max_concurrency: int = 10,
+        use_batch_api: bool = False,
+    ) -> list[dict]:
+        """Run an agent over many messages, returning results in order.
+
+        By default each message is sent as its own run request, with up to
+        ``max_concurrency`` requests in flight. With ``use_batch_api=True``
+        all messages are posted to the batch endpoint in one request.
+        """
+        if use_batch_api:
+            data = _batch_payload(messages, context)
+            response = self._client._request("POST", f"/agents/{agent_id}/batch", json=data)
+            return response["items"]
+        processor = BatchProcessor(
+            lambda m: self.run(agent_id, m, context),
+            max_concurrency=max_concurrency,
+        )
+        return processor.run(messages)
+
 
 class WorkflowsAPI:
     """API for managing workflows."""
@@ -188,6 +340,10 @@ class ExecutionsAPI:
         """Get an execution by ID."""
         return self._client._request("GET", f"/executions/{execution_id}")
 
+    def iter(self, execution_id: str) -> Iterator[dict]:
+        """Iterate over an execution's steps without loading them all at once."""
+        return self._client._stream("GET", f"/executions/{execution_id}")
+
     def list(self, limit: int = 20, offset: int = 0) -> dict:
         """List all executions."""
         return self._client._request(
@@ -195,3 +351,402 @@ class ExecutionsAPI:
             "/executions",
             params={"limit": limit, "offset": offset},
         )
+
+
+class AsyncClient:
+    """Asynchronous client for interacting with the Gagiteck API.
+
+    Mirrors :class:`Client`, but every API method is a coroutine so many
+    calls can be awaited concurrently (e.g. with ``asyncio.gather``). The
+    number of in-flight requests is bounded by ``max_concurrency``.
+
+    Args:
+        api_key: Your Gagiteck API key (starts with 'ggt_')
+        base_url: API base URL (default: https://api.gagiteck.com/v1)
+        timeout: Request timeout in seconds (default: 30)
+        debug: Enable debug logging (default: False)
+        max_concurrency: Maximum concurrent requests (default: 10)
+        pool_limits: Connection pool limits (default: DEFAULT_POOL_LIMITS)
+        http2: Use HTTP/2 (default: enabled when ``h2`` is installed)
+        max_retries: Retries on HTTP 429 before raising RateLimitError (default: 3)
+
+    Example:
+        >>> import asyncio
+        >>> from gagiteck import AsyncClient
+        >>> async def main():
+        ...     async with AsyncClient(api_key="ggt_your_key_here") as client:
+        ...         return await asyncio.gather(
+        ...             *(client.agents.run("agent_123", m) for m in messages)
+        ...         )
+    """
+
+    DEFAULT_BASE_URL = Client.DEFAULT_BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        debug: bool = False,
+        max_concurrency: int = 10,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        max_retries: int = 3,
+    ):
+        _validate_api_key(api_key)
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.api_key = api_key
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.debug = debug
+        self.max_concurrency = max_concurrency
+        self.pool_limits = pool_limits or DEFAULT_POOL_LIMITS
+        self.http2 = _HTTP2_AVAILABLE if http2 is None else http2
+        self.max_retries = max_retries
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http_client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": "gagiteck-python/0.1.0",
+            },
+            timeout=timeout,
+            limits=self.pool_limits,
+            http2=self.http2,
+        )
+
+        self._coalescer: Optional[BatchCoalescer] = None
+
+        # Initialize API resources
+        self.agents = AsyncAgentsAPI(self)
+        self.workflows = AsyncWorkflowsAPI(self)
+        self.executions = AsyncExecutionsAPI(self)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> dict:
+        """Make an HTTP request to the API, retrying when rate limited."""
+        for attempt in range(self.max_retries + 1):
+            # The semaphore is released while backing off
+            async with self._semaphore:
+                try:
+                    response = await self._http_client.request(
+                        method=method,
+                        url=path,
+                        content=_dumps(json) if json is not None else None,
+                        params=params,
+                    )
+                    response.raise_for_status()
+                    return _loads(response.content)
+                except httpx.HTTPStatusError as e:
+                    error = _api_error(e.response)
+                    if not isinstance(error, RateLimitError) or attempt == self.max_retries:
+                        raise error
+                except httpx.RequestError as e:
+                    raise APIError(code=0, message=str(e))
+            await asyncio.sleep(_retry_delay(error, attempt))
+
+    async def _stream(
+        self,
+        method: str,
+        path: str,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream an NDJSON response, yielding one decoded object per line.
+
+        A ``max_concurrency`` slot is only held while the request is sent
+        and the response headers arrive, not while the body is consumed.
+        The connection itself stays checked out until the generator is
+        exhausted or closed, so callers that stop early should close it
+        (e.g. with ``contextlib.aclosing``).
+        """
+        request = self._http_client.build_request(
+            method,
+            path,
+            content=_dumps(json) if json is not None else None,
+            params=params,
+            headers=_NDJSON_HEADERS,
+        )
+        try:
+            async with self._semaphore:
+                response = await self._http_client.send(request, stream=True)
+            try:
+                if response.is_error:
+                    await response.aread()
+                    raise _api_error(response)
+                async for line in response.aiter_lines():
+                    if line:
+                        yield _loads(line)
+            finally:
+                await response.aclose()
+        except httpx.RequestError as e:
+            raise APIError(code=0, message=str(e))
+
+    def enable_coalescing(self, max_batch: int = 8, max_wait_ms: float = 50) -> None:
+        """Coalesce concurrent ``agents.run`` calls into batch requests.
+
+        Runs issued within ``max_wait_ms`` of each other are sent together
+        to the batch endpoint, up to ``max_batch`` at a time. Each call still
+        returns its own result. Calling this again updates the settings.
+        """
+        if self._coalescer is not None:
+            # Reuse the running coalescer rather than orphaning its worker
+            self._coalescer.max_batch = max_batch
+            self._coalescer.max_wait_ms = max_wait_ms
+            return
+        self._coalescer = BatchCoalescer(
+            self._send_batch_run,
+            max_batch=max_batch,
+            max_wait_ms=max_wait_ms,
+        )
+
+    async def _send_batch_run(self, items: list[dict]) -> list[dict]:
+        response = await self._request("POST", "/agents/batch_run", json={"items": items})
+        return response["items"]
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._coalescer is not None:
+            await self._coalescer.close()
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+
+class AsyncAgentsAPI:
+    """Async API for managing agents."""
+
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def list(self, limit: int = 20, offset: int = 0) -> dict:
+        """List all agents."""
+        return await self._client._request(
+            "GET",
+            "/agents",
+            params={"limit": limit, "offset": offset},
+        )
+
+    async def get(self, agent_id: str) -> dict:
+        """Get an agent by ID."""
+        return await self._client._request("GET", f"/agents/{agent_id}")
+
+    async def create(
+        self,
+        name: str,
+        model: str = "claude-3-sonnet",
+        system_prompt: Optional[str] = None,
+        tools: Optional[list] = None,
+        **kwargs,
+    ) -> dict:
+        """Create a new agent."""
+        data = {
+            "name": name,
+            "model": model,
+            "system_prompt": system_prompt,
+            "tools": tools or [],
+            **kwargs,
+        }
+        return await self._client._request("POST", "/agents", json=data)
+
+    async def update(self, agent_id: str, **kwargs) -> dict:
+        """Update an agent."""
+        return await self._client._request("PATCH", f"/agents/{agent_id}", json=kwargs)
+
+    async def delete(self, agent_id: str) -> None:
+        """Delete an agent."""
+        await self._client._request("DELETE", f"/agents/{agent_id}")
+
+    async def run(
+        self,
+        agent_id: str,
+        message: str,
+        context: Optional[dict] = None,
+    ) -> dict:
+        """Run an agent with a message."""
+        data = {"message": message}
+        if context:
+            data["context"] = context
+        if self._client._coalescer is not None:
+            return await self._client._coalescer.submit({"agent_id": agent_id, **data})
+        return await self._client._request("POST", f"/agents/{agent_id}/run", json=data)
+
+    async def summarize(self, messages: list[dict], summary: Optional[str] = None) -> dict:
+        """Summarize conversation messages, extending an existing summary."""
+        data = {"messages": messages}
+        if summary:
+            data["summary"] = summary
+        return await self._client._request("POST", "/agents/summarize", json=data)
+
+    async def batch_run(
+        self,
+        agent_id: str,
+        messages: list[str],
+        context: Optional[dict] = None,
+        use_batch_api: bool = False,
+    ) -> list[dict]:
+        """Run an agent over many messages, returning results in order.
+
+        Requests are issued concurrently, bounded by the client's
+        ``max_concurrency``. With ``use_batch_api=True`` all messages are
+        posted to the batch endpoint in one request.
+        """
+        if use_batch_api:
+            data = _batch_payload(messages, context)
+            response = await self._client._request(
+                "POST", f"/agents/{agent_id}/batch", json=data
+            )
+            return response["items"]
+        return await asyncio.gather(*(self.run(agent_id, m, context) for m in messages))
+
+
+class AsyncWorkflowsAPI:
+    """Async API for managing workflows."""
+
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def list(self, limit: int = 20, offset: int = 0) -> dict:
+        """List all workflows."""
+        return await self._client._request(
+            "GET",
+            "/workflows",
+            params={"limit": limit, "offset": offset},
+        )
+
+    async def get(self, workflow_id: str) -> dict:
+        """Get a workflow by ID."""
+        return await self._client._request("GET", f"/workflows/{workflow_id}")
+
+    async def trigger(self, workflow_id: str, inputs: Optional[dict] = None) -> dict:
+        """Trigger a workflow."""
+        return await self._client._request(
+            "POST",
+            f"/workflows/{workflow_id}/trigger",
+            json={"inputs": inputs or {}},
+        )
+
+
+class AsyncExecutionsAPI:
+    """Async API for managing executions."""
+
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(self, execution_id: str) -> dict:
+        """Get an execution by ID."""
+        return await self._client._request("GET", f"/executions/{execution_id}")
+
+    def iter(self, execution_id: str) -> AsyncIterator[dict]:
+        """Iterate over an execution's steps without loading them all at once.
+
+        If you may stop before the end, close the iterator so its connection
+        is released promptly::
+
+            async with contextlib.aclosing(client.executions.iter(eid)) as steps:
+                async for step in steps:
+                    ...
+        """
+        return self._client._stream("GET", f"/executions/{execution_id}")
+
+    async def list(self, limit: int = 20, offset: int = 0) -> dict:
+        """List all executions."""
+        return await self._client._request(
+            "GET",
+            "/executions",
+            params={"limit": limit, "offset": offset},
+        )
+
+
+def _batch_payload(messages: list[str], context: Optional[dict]) -> dict:
+    """Build the request body for the agent batch endpoint."""
+    items = []
+    for message in messages:
+        item = {"message": message}
+        if context:
+            item["context"] = context
+        items.append(item)
+    return {"items": items}
+
+
+def _validate_api_key(api_key: Optional[str]) -> None:
+    """Reject missing or malformed API keys before any request is made."""
+    if not api_key:
+        raise AuthenticationError("API key is required")
+
+    if not _API_KEY_RE.fullmatch(api_key):
+        raise AuthenticationError(
+            "Invalid API key format. Key should start with 'ggt_' followed by "
+            "at least 8 letters, digits or underscores"
+        )
+
+
+def _acquire_http_client(key: tuple, factory: Callable[[], httpx.Client]) -> _PoolEntry:
+    """Take a reference to the shared HTTP client for ``key``, creating it if needed."""
+    with _POOL_LOCK:
+        entry = _POOL.get(key)
+        if entry is None or entry.http_client.is_closed:
+            # A closed entry keeps its own count; its holders release it
+            entry = _POOL[key] = _PoolEntry(factory())
+        entry.refs += 1
+        return entry
+
+
+def _release_http_client(key: tuple, entry: _PoolEntry) -> None:
+    """Drop a reference to a shared HTTP client, closing it on the last one."""
+    with _POOL_LOCK:
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+        if _POOL.get(key) is entry:
+            del _POOL[key]
+    entry.http_client.close()
+
+
+def _api_error(response: httpx.Response) -> GagiteckError:
+    """Map an error response to the matching SDK exception."""
+    if response.status_code == 401:
+        return AuthenticationError("Invalid or expired API key")
+    if response.status_code == 429:
+        try:
+            retry_after = int(response.headers.get("Retry-After", 1))
+        except ValueError:
+            retry_after = 1
+        return RateLimitError(response.text, retry_after=retry_after)
+    return APIError(code=response.status_code, message=response.text)
+
+
+def _retry_delay(error: RateLimitError, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After or exponential backoff, plus jitter."""
+    return max(error.retry_after, 2**attempt) + random.random()
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode a request body as JSON, using orjson when available."""
+    if orjson is not None:
+        # Coerce non-str keys like the stdlib encoder does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(content: bytes | str) -> Any:
+    """Decode a JSON response body. Empty bodies (e.g. 204) decode to None."""
+    if not content:
+        return None
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -14,7 +14,11 @@ class APIError(GagiteckError):
 
     def __init__(self, code: int, message: str):
         self.code = code
-        super().__init__(f"API Error {code}: {message}")
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        # Formatted on demand so retry loops that swallow errors stay cheap
+        return f"API Error {self.code}: {self.message}"
 
 
 class AuthenticationError(GagiteckError):
@@ -48,4 +52,7 @@ class ToolError(GagiteckError):
 
     def __init__(self, tool_name: str, message: str):
         self.tool_name = tool_name
-        super().__init__(f"Tool '{tool_name}' failed: {message}")
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return f"Tool '{self.tool_name}' failed: {self.message}"
@@ -2,10 +2,24 @@
 
 from typing import Any, Callable, Optional, get_type_hints
 from dataclasses import dataclass, field
+import copy
 import inspect
 
 
-@dataclass
+_TYPE_MAP = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+# Attribute used to cache the schema derived from a plain function
+_TOOL_ATTR = "__gagiteck_tool__"
+
+
+@dataclass(slots=True)
 class Tool:
     """A tool that agents can use.
 
@@ -35,6 +49,14 @@ class Tool:
     parameters: dict = field(default_factory=dict)
     function: Optional[Callable] = None
 
+    _api_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_api_dict":
+            # Any field change invalidates the cached API dictionary
+            object.__setattr__(self, "_api_dict", None)
+
     def __call__(self, **kwargs) -> Any:
         """Execute the tool."""
         if self.function is None:
@@ -42,15 +64,21 @@ class Tool:
         return self.function(**kwargs)
 
     def to_dict(self) -> dict:
-        """Convert to API-compatible dictionary."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """Convert to API-compatible dictionary.
+
+        The dictionary is built once and the same object is returned on
+        later calls, so treat it (and ``parameters``) as read-only.
+        """
+        if self._api_dict is None:
+            self._api_dict = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return self._api_dict
 
     @classmethod
     def from_function(cls, func: Callable) -> "Tool":
@@ -58,7 +86,21 @@ class Tool:
 
         The function's docstring becomes the description.
         Type hints are used to generate the parameter schema.
+        The derived schema is cached on the function, so converting the
+        same function again skips introspection; each call still returns a
+        new Tool that can be edited independently.
         """
+        cacheable = inspect.isfunction(func)
+        cached = func.__dict__.get(_TOOL_ATTR) if cacheable else None
+        if cached is not None:
+            name, description, parameters = cached
+            return cls(
+                name=name,
+                description=description,
+                parameters=copy.deepcopy(parameters),
+                function=func,
+            )
+
         name = func.__name__
         description = func.__doc__ or f"Execute {name}"
 
@@ -91,9 +133,12 @@ class Tool:
         if required:
             parameters["required"] = required
 
+        description = description.strip()
+        if cacheable:
+            setattr(func, _TOOL_ATTR, (name, description, copy.deepcopy(parameters)))
         return cls(
             name=name,
-            description=description.strip(),
+            description=description,
             parameters=parameters,
             function=func,
         )
@@ -115,12 +160,4 @@ def tool(func: Callable) -> Tool:
 
 def _python_type_to_json(python_type: type) -> str:
     """Convert Python type to JSON schema type."""
-    type_map = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-    }
-    return type_map.get(python_type, "string")
+    return _TYPE_MAP.get(python_type, "string")
@@ -0,0 +1,51 @@
+"""Shared fixtures for Gagiteck SDK tests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Route HTTP traffic from Client/AsyncClient through a mock handler.
+
+    Call the fixture with a handler before creating clients::
+
+        mock_api(lambda request: httpx.Response(200, json={}))
+        with Client(api_key="ggt_test_key") as client:
+            ...
+
+    Clients are built through the normal code path (including the shared
+    connection pool, which is isolated per test), and every mock HTTP
+    client is closed on teardown.
+    """
+    created = []
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+    monkeypatch.setattr("gagiteck.client._POOL", {})
+
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+
+        class MockClient(real_client):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **{**kwargs, "transport": transport})
+                created.append(self)
+
+        class MockAsyncClient(real_async_client):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **{**kwargs, "transport": transport})
+                created.append(self)
+
+        monkeypatch.setattr(httpx, "Client", MockClient)
+        monkeypatch.setattr(httpx, "AsyncClient", MockAsyncClient)
+
+    yield install
+
+    for client in created:
+        if client.is_closed:
+            continue
+        if isinstance(client, real_async_client):
+            asyncio.run(client.aclose())
+        else:
+            client.close()
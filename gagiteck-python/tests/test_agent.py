@@ -0,0 +1,318 @@
+"""Tests for the Agent class."""
+
+import pytest
+from gagiteck import Agent, tool
+
+
+class TestAgentMemory:
+    """Tests for agent conversation memory."""
+
+    def test_memory_disabled_keeps_no_history(self):
+        """Agents without memory should not accumulate history."""
+        agent = Agent(name="Stateless")
+        agent.run("hello")
+        agent.run("again")
+        assert len(agent._conversation_history) == 0
+
+    def test_memory_records_turns(self):
+        """Agents with memory should record user and assistant turns."""
+        agent = Agent(name="Stateful", memory_enabled=True)
+        agent.run("hello")
+        assert [m["role"] for m in agent._conversation_history] == ["user", "assistant"]
+
+    def test_memory_window_evicts_oldest_turns(self):
+        """History should be capped at memory_window turn pairs."""
+        agent = Agent(name="Windowed", memory_enabled=True, memory_window=2)
+        for i in range(5):
+            agent.run(f"message {i}")
+
+        history = list(agent._conversation_history)
+        assert len(history) == 4
+        assert history[0] == {"role": "user", "content": "message 3"}
+
+    def test_full_window_request_starts_with_user(self):
+        """A full window should not evict the user turn from the request."""
+        agent = Agent(name="Windowed", memory_enabled=True, memory_window=2)
+        for i in range(3):
+            agent.run(f"message {i}")
+
+        messages = agent._build_request("message 3")["messages"]
+        assert messages[0] == {"role": "user", "content": "message 1"}
+        assert [m["role"] for m in messages] == ["user", "assistant", "user", "assistant", "user"]
+        assert messages[-1] == {"role": "user", "content": "message 3"}
+
+    def test_rejects_empty_memory_window(self):
+        """memory_window must hold at least one turn pair."""
+        with pytest.raises(ValueError):
+            Agent(name="Empty", memory_window=0)
+
+    def test_clear_memory(self):
+        """clear_memory should empty the history."""
+        agent = Agent(name="Stateful", memory_enabled=True)
+        agent.run("hello")
+        agent.clear_memory()
+        assert len(agent._conversation_history) == 0
+
+    def test_buffer_mode_keeps_all_turns(self):
+        """Buffer mode should not evict any turns."""
+        agent = Agent(name="Buffered", memory_enabled=True, memory_mode="buffer", memory_window=1)
+        for i in range(5):
+            agent.run(f"message {i}")
+        assert len(agent._conversation_history) == 10
+
+    def test_summary_mode_folds_old_turns(self):
+        """Summary mode should summarize old turns once over the threshold."""
+        calls = []
+
+        class FakeAgentsAPI:
+            def summarize(self, messages, summary=None):
+                calls.append((messages, summary))
+                return {"summary": f"summary {len(calls)}"}
+
+        class FakeClient:
+            agents = FakeAgentsAPI()
+
+        agent = Agent(
+            name="Summarizing",
+            memory_enabled=True,
+            memory_mode="summary",
+            memory_window=1,
+            summary_threshold=4,
+            _client=FakeClient(),
+        )
+        for i in range(3):
+            agent.run(f"message {i}")
+        assert calls == []
+
+        agent.run("message 3")
+        assert len(calls) == 1
+        assert [m["content"] for m in calls[0][0]] == [
+            "message 0",
+            "[Agent 'Summarizing' would process: message 0]",
+            "message 1",
+            "[Agent 'Summarizing' would process: message 1]",
+        ]
+        assert agent._summary == "summary 1"
+        assert [m["content"] for m in agent._conversation_history][0] == "message 2"
+
+    def test_summary_mode_defaults_summarize_rarely(self):
+        """With default settings, summarization should not run every turn."""
+        calls = []
+
+        class FakeAgentsAPI:
+            def summarize(self, messages, summary=None):
+                calls.append(messages)
+                return {"summary": f"summary {len(calls)}"}
+
+        class FakeClient:
+            agents = FakeAgentsAPI()
+
+        agent = Agent(
+            name="Defaults", memory_enabled=True, memory_mode="summary", _client=FakeClient()
+        )
+        for i in range(40):
+            agent.run(f"message {i}")
+
+        # Rollovers on turns 22 and 33, each folding 11 full turn pairs
+        assert [len(m) for m in calls] == [22, 22]
+
+    def test_summary_failure_keeps_history(self):
+        """A failed summarize call should not drop or unbalance any turns."""
+        failures = [RuntimeError("summarize failed")]
+
+        class FlakyAgentsAPI:
+            def summarize(self, messages, summary=None):
+                if failures:
+                    raise failures.pop()
+                return {"summary": "recovered"}
+
+        class FakeClient:
+            agents = FlakyAgentsAPI()
+
+        class RecordingAgent(Agent):
+            def _build_request(self, message):
+                request = super()._build_request(message)
+                self.sent.append(request["messages"])
+                return request
+
+        agent = RecordingAgent(
+            name="Fragile",
+            memory_enabled=True,
+            memory_mode="summary",
+            memory_window=1,
+            summary_threshold=4,
+            _client=FakeClient(),
+        )
+        agent.sent = []
+        for message in ["m0", "m1", "m2"]:
+            agent.run(message)
+        with pytest.raises(RuntimeError):
+            agent.run("m3")
+
+        assert [m["content"] for m in agent._conversation_history][::2] == ["m0", "m1", "m2"]
+        assert agent._summary == ""
+
+        agent.run("m4")
+        assert [m["role"] for m in agent.sent[-1]] == ["system", "user", "assistant", "user"]
+        assert agent.sent[-1][-1]["content"] == "m4"
+
+    def test_rejects_async_client(self):
+        """Agents need a synchronous client for summarization."""
+
+        class AsyncAgentsAPI:
+            async def summarize(self, messages, summary=None):
+                return {"summary": ""}
+
+        class FakeAsyncClient:
+            agents = AsyncAgentsAPI()
+
+        with pytest.raises(TypeError):
+            Agent(name="Async", memory_mode="summary", _client=FakeAsyncClient())
+
+    def test_rejects_low_summary_threshold(self):
+        """summary_threshold must leave room between rollovers."""
+        with pytest.raises(ValueError):
+            Agent(name="Tight", memory_mode="summary", memory_window=10, summary_threshold=20)
+
+    def test_invalid_memory_mode(self):
+        """Unknown memory modes should be rejected."""
+        with pytest.raises(ValueError):
+            Agent(name="Broken", memory_mode="infinite")
+
+    def test_summary_mode_keeps_prefix_stable(self):
+        """Requests between summary rollovers should extend the previous one."""
+
+        class RecordingAgent(Agent):
+            def _build_messages(self, message):
+                messages = super()._build_messages(message)
+                self.sent.append(messages)
+                return messages
+
+        agent = RecordingAgent(
+            name="Cached",
+            memory_enabled=True,
+            memory_mode="summary",
+            memory_window=1,
+            summary_threshold=8,
+        )
+        agent.sent = []
+        summaries = []
+        for i in range(10):
+            agent.run(f"message {i}")
+            summaries.append(agent._summary)
+
+        rollovers = []
+        for i in range(1, len(agent.sent)):
+            previous, current = agent.sent[i - 1], agent.sent[i]
+            if summaries[i] != summaries[i - 1]:
+                rollovers.append(i)
+                continue
+            assert current[: len(previous)] == previous
+
+        # History passes the threshold of 8 messages before the 6th and 10th turns
+        assert rollovers == [5, 9]
+        assert agent.sent[-1][0]["role"] == "system"
+
+
+class TestAgentTools:
+    """Tests for agent tool handling."""
+
+    def test_callables_become_tools(self):
+        """Plain functions should be converted to Tool objects."""
+
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        agent = Agent(name="Tooled", tools=[lookup])
+        assert agent.tools[0].name == "lookup"
+        assert agent._build_request("hi")["tools"] == [agent.tools[0].to_dict()]
+
+    def test_add_tool_updates_payload(self):
+        """Tools added with add_tool should be sent with the next run."""
+
+        @tool
+        def search(query: str) -> str:
+            """Search."""
+            return query
+
+        agent = Agent(name="Tooled")
+        agent.add_tool(search)
+        assert agent.tools == [search]
+        assert agent._build_request("hi")["tools"] == [search.to_dict()]
+
+    def test_agents_from_same_function_have_independent_tools(self):
+        """Editing one agent's tool should not affect another built from the same function."""
+
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        first = Agent(name="First", tools=[lookup])
+        second = Agent(name="Second", tools=[lookup])
+        assert first.tools[0] is not second.tools[0]
+
+        first.tools[0].description = "Look up a key in the cache."
+        first.tools[0].parameters["properties"]["key"]["description"] = "Cache key"
+        schema = second._build_request("hi")["tools"][0]["function"]
+        assert schema["description"] == "Look up a key."
+        assert schema["parameters"]["properties"]["key"]["description"] == "Parameter: key"
+
+    def test_tool_changes_after_agent_creation(self):
+        """Editing a tool after building the agent should not send a stale schema."""
+
+        @tool
+        def lookup(key: str) -> str:
+            """Look up a key."""
+            return key
+
+        agent = Agent(name="Tooled", tools=[lookup])
+        agent._build_request("first")
+        lookup.description = "Look up a key in the cache."
+
+        schema = agent._build_request("second")["tools"][0]
+        assert schema["function"]["description"] == "Look up a key in the cache."
+
+
+class TestAgentResponse:
+    """Tests for the AgentResponse class."""
+
+    def test_text_property(self):
+        """text should return the response content."""
+        from gagiteck.agent import AgentResponse
+
+        response = AgentResponse(content="hello", model="claude-3-sonnet")
+        assert response.text == "hello"
+
+    def test_uses_slots(self):
+        """Models should not carry a per-instance __dict__."""
+        from gagiteck.agent import AgentResponse
+
+        response = AgentResponse(content="hello", model="claude-3-sonnet")
+        assert not hasattr(response, "__dict__")
+        assert not hasattr(Agent(name="Slotted"), "__dict__")
+
+
+class TestAgentRequest:
+    """Tests for agent request assembly."""
+
+    def test_request_omits_unset_fields(self):
+        """System prompt and tools should be left out when not set."""
+        agent = Agent(name="Plain", max_tokens=100, temperature=0.5)
+        assert agent._build_request("hi") == {
+            "model": "claude-3-sonnet",
+            "messages": [{"role": "user", "content": "hi"}],
+            "max_tokens": 100,
+            "temperature": 0.5,
+        }
+
+    def test_request_includes_system_and_tools(self):
+        """System prompt and tools should be included when set."""
+
+        def noop() -> None:
+            """Do nothing."""
+
+        agent = Agent(name="Full", system_prompt="Be brief.", tools=[noop])
+        request = agent._build_request("hi")
+        assert request["system"] == "Be brief."
+        assert request["tools"] == [agent.tools[0].to_dict()]
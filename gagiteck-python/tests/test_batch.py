@@ -0,0 +1,209 @@
+"""Tests for batch processing."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from gagiteck import Agent, AsyncClient, BatchCoalescer, BatchProcessor, Client
+
+
+class TestBatchProcessor:
+    """Tests for the BatchProcessor class."""
+
+    def test_preserves_input_order(self):
+        """Results should come back in input order."""
+        processor = BatchProcessor(lambda x: x * 2, max_concurrency=3)
+        assert processor.run([1, 2, 3, 4, 5]) == [2, 4, 6, 8, 10]
+
+    async def test_bounds_concurrency(self):
+        """No more than max_concurrency calls should run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def work(x):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return x
+
+        processor = BatchProcessor(work, max_concurrency=4)
+        assert await processor.run_batch(range(20)) == list(range(20))
+        assert peak == 4
+
+    async def test_run_inside_event_loop(self):
+        """The sync wrapper should work while an event loop is running."""
+        processor = BatchProcessor(lambda x: x + 1)
+        assert processor.run([1, 2]) == [2, 3]
+
+    @pytest.mark.filterwarnings("error::RuntimeWarning")
+    def test_awaits_awaitables_from_sync_callables(self):
+        """Awaitables returned by plain callables should be awaited."""
+
+        async def double(x):
+            await asyncio.sleep(0)
+            return x * 2
+
+        processor = BatchProcessor(lambda x: double(x))
+        assert processor.run([1, 2, 3]) == [2, 4, 6]
+
+    def test_rate_limit(self):
+        """rate_limit should cap how many calls start per second."""
+        processor = BatchProcessor(lambda x: x, max_concurrency=10, rate_limit=20)
+        start = time.monotonic()
+        processor.run(range(30))
+        assert time.monotonic() - start >= 0.4
+
+    def test_rejects_invalid_concurrency(self):
+        """max_concurrency must be at least 1."""
+        with pytest.raises(ValueError):
+            BatchProcessor(lambda x: x, max_concurrency=0)
+
+
+class TestBatchCoalescer:
+    """Tests for the BatchCoalescer class."""
+
+    async def test_coalesces_up_to_max_batch(self):
+        """Concurrent submissions should be grouped into batches."""
+        batches = []
+
+        async def send(payloads):
+            batches.append(payloads)
+            return [p * 10 for p in payloads]
+
+        coalescer = BatchCoalescer(send, max_batch=4, max_wait_ms=50)
+        results = await asyncio.gather(*(coalescer.submit(i) for i in range(10)))
+        await coalescer.close()
+
+        assert results == [i * 10 for i in range(10)]
+        assert [len(b) for b in batches] == [4, 4, 2]
+
+    async def test_flushes_after_max_wait(self):
+        """A partial batch should be sent once max_wait_ms elapses."""
+
+        async def send(payloads):
+            return payloads
+
+        coalescer = BatchCoalescer(send, max_batch=100, max_wait_ms=10)
+        assert await asyncio.wait_for(coalescer.submit("solo"), 1) == "solo"
+        await coalescer.close()
+
+    async def test_zero_wait_drains_queued_payloads(self):
+        """With max_wait_ms=0, payloads already queued should share a batch."""
+        batches = []
+
+        async def send(payloads):
+            batches.append(payloads)
+            return payloads
+
+        coalescer = BatchCoalescer(send, max_batch=8, max_wait_ms=0)
+        assert await asyncio.gather(*(coalescer.submit(i) for i in range(4))) == [0, 1, 2, 3]
+        await coalescer.close()
+        assert batches == [[0, 1, 2, 3]]
+
+    async def test_close_flushes_partial_batch(self):
+        """close() should send payloads still waiting for a batch to fill."""
+
+        async def send(payloads):
+            return [p * 2 for p in payloads]
+
+        coalescer = BatchCoalescer(send, max_batch=8, max_wait_ms=10_000)
+        pending = asyncio.ensure_future(coalescer.submit(1))
+        await asyncio.sleep(0.01)
+        await coalescer.close()
+        assert await asyncio.wait_for(pending, 1) == 2
+
+    async def test_propagates_errors(self):
+        """A failed batch should fail every caller in it."""
+
+        async def send(payloads):
+            raise RuntimeError("boom")
+
+        coalescer = BatchCoalescer(send, max_batch=2, max_wait_ms=10)
+        results = await asyncio.gather(
+            coalescer.submit(1), coalescer.submit(2), return_exceptions=True
+        )
+        await coalescer.close()
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_async_client_coalesces_runs(self, mock_api):
+        """enable_coalescing should route agents.run through the batch endpoint."""
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            items = json.loads(request.content)["items"]
+            results = [{"agent": i["agent_id"], "output": i["message"]} for i in items]
+            return httpx.Response(200, json={"items": results})
+
+        mock_api(handler)
+        async with AsyncClient(api_key="ggt_test_key") as client:
+            client.enable_coalescing(max_batch=8, max_wait_ms=20)
+            results = await asyncio.gather(
+                client.agents.run("agent_a", "one"),
+                client.agents.run("agent_b", "two"),
+            )
+
+        assert len(requests) == 1
+        assert requests[0].url.path.endswith("/agents/batch_run")
+        assert results == [
+            {"agent": "agent_a", "output": "one"},
+            {"agent": "agent_b", "output": "two"},
+        ]
+
+    async def test_enable_coalescing_twice_reuses_coalescer(self):
+        """Re-enabling coalescing should update settings, not leak a worker."""
+        async with AsyncClient(api_key="ggt_test_key") as client:
+            client.enable_coalescing(max_batch=4, max_wait_ms=10)
+            coalescer = client._coalescer
+            client.enable_coalescing(max_batch=16, max_wait_ms=5)
+            assert client._coalescer is coalescer
+            assert (coalescer.max_batch, coalescer.max_wait_ms) == (16, 5)
+
+
+class TestBatchRun:
+    """Tests for batch agent runs."""
+
+    def test_agents_batch_run(self, mock_api):
+        """batch_run should issue one run per message, in order."""
+
+        def handler(request):
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"output": body["message"].upper()})
+
+        mock_api(handler)
+        with Client(api_key="ggt_test_key") as client:
+            results = client.agents.batch_run("agent_123", ["a", "b", "c"])
+
+        assert results == [{"output": "A"}, {"output": "B"}, {"output": "C"}]
+
+    def test_agents_batch_run_uses_batch_api(self, mock_api):
+        """use_batch_api should send all messages in a single request."""
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            items = json.loads(request.content)["items"]
+            return httpx.Response(200, json={"items": [{"output": i["message"]} for i in items]})
+
+        mock_api(handler)
+        with Client(api_key="ggt_test_key") as client:
+            results = client.agents.batch_run("agent_123", ["a", "b"], use_batch_api=True)
+
+        assert len(requests) == 1
+        assert requests[0].url.path.endswith("/agents/agent_123/batch")
+        assert results == [{"output": "a"}, {"output": "b"}]
+
+    def test_agent_run_batch(self):
+        """Agent.run_batch should return one response per message."""
+        agent = Agent(name="Batcher")
+        responses = agent.run_batch(["one", "two"])
+        assert [r.content for r in responses] == [
+            "[Agent 'Batcher' would process: one]",
+            "[Agent 'Batcher' would process: two]",
+        ]
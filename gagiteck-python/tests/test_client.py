@@ -1,7 +1,20 @@
 """Tests for the Gagiteck client."""
 
+import asyncio
+import json
+import subprocess
+import sys
+
+import httpx
 import pytest
-from gagiteck import Client, GagiteckError, AuthenticationError
+from gagiteck import (
+    Client,
+    AsyncClient,
+    APIError,
+    GagiteckError,
+    AuthenticationError,
+    RateLimitError,
+)
 
 
 class TestClient:
@@ -17,6 +30,16 @@ class TestClient:
         with pytest.raises(AuthenticationError):
             Client(api_key="invalid_key")
 
+    def test_client_rejects_short_api_key(self):
+        """Client should reject keys that are too short."""
+        with pytest.raises(AuthenticationError):
+            Client(api_key="ggt_short")
+
+    def test_client_rejects_invalid_key_characters(self):
+        """Client should reject keys with unexpected characters."""
+        with pytest.raises(AuthenticationError):
+            Client(api_key="ggt_test key!")
+
     def test_client_accepts_valid_api_key(self):
         """Client should accept valid API key format."""
         client = Client(api_key="ggt_test_key_12345")
@@ -43,9 +66,343 @@ class TestClient:
         with Client(api_key="ggt_test_key") as client:
             assert client.api_key == "ggt_test_key"
 
+    def test_client_default_pool_limits(self):
+        """Client should use tuned keep-alive pool limits by default."""
+        from gagiteck.client import DEFAULT_POOL_LIMITS
+
+        with Client(api_key="ggt_test_key") as client:
+            assert client.pool_limits == DEFAULT_POOL_LIMITS
+
+    def test_client_custom_pool_limits(self):
+        """Client should accept custom pool limits."""
+
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        with Client(api_key="ggt_test_key", pool_limits=limits, http2=False) as client:
+            assert client.pool_limits == limits
+            assert client.http2 is False
+
     def test_client_has_api_resources(self):
         """Client should have API resources."""
         with Client(api_key="ggt_test_key") as client:
             assert hasattr(client, "agents")
             assert hasattr(client, "workflows")
             assert hasattr(client, "executions")
+
+    def test_clients_share_connection_pool(self):
+        """Clients with the same settings should share one HTTP client."""
+        first = Client(api_key="ggt_first_key")
+        second = Client(api_key="ggt_second_key")
+        other = Client(api_key="ggt_first_key", base_url="https://custom.api.com/v1")
+        try:
+            assert first._http_client is second._http_client
+            assert other._http_client is not first._http_client
+        finally:
+            other.close()
+
+        shared = second._http_client
+        first.close()
+        assert not shared.is_closed
+        second.close()
+        assert shared.is_closed
+
+    def test_auth_header_sent_per_request(self, mock_api):
+        """Each client should send its own API key on a shared pool."""
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={})
+
+        mock_api(handler)
+        first = Client(api_key="ggt_first_key")
+        second = Client(api_key="ggt_second_key")
+        assert first._http_client is second._http_client
+        first.agents.list()
+        second.agents.list()
+        first.close()
+        second.close()
+
+        assert seen == ["Bearer ggt_first_key", "Bearer ggt_second_key"]
+
+    def test_shared_pool_does_not_leak_cookies(self, mock_api):
+        """Cookies set for one tenant must not be sent by another."""
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, json={}, headers={"Set-Cookie": "session=tenantA"})
+
+        mock_api(handler)
+        with Client(api_key="ggt_tenant_aaaa") as tenant_a:
+            with Client(api_key="ggt_tenant_bbbb") as tenant_b:
+                tenant_a.agents.list()
+                tenant_b.agents.list()
+
+        assert seen == [None, None]
+
+    def test_replaced_pool_entry_survives_stale_release(self):
+        """Releasing a closed, replaced client must not close its replacement."""
+        stale = Client(api_key="ggt_first_key")
+        stale._http_client.close()
+        fresh = Client(api_key="ggt_second_key")
+        assert fresh._http_client is not stale._http_client
+
+        stale.close()
+        assert not fresh._http_client.is_closed
+        replacement = fresh._http_client
+        fresh.close()
+        assert replacement.is_closed
+
+    def test_closed_client_rejects_requests(self):
+        """A closed Client must not keep using a pool shared with others."""
+        first = Client(api_key="ggt_first_key")
+        second = Client(api_key="ggt_second_key")
+        first.close()
+        assert first._http_client is None
+
+        with pytest.raises(GagiteckError, match="closed"):
+            first.agents.list()
+        with pytest.raises(GagiteckError, match="closed"):
+            list(first.executions.iter("exec_123"))
+        second.close()
+
+
+class TestClientSerialization:
+    """Tests for request and response encoding."""
+
+    def test_request_body_round_trips(self, mock_api):
+        """JSON bodies should be encoded and responses decoded."""
+
+        seen = []
+
+        def handler(request):
+            seen.append((request.headers["Content-Type"], json.loads(request.content)))
+            return httpx.Response(200, json={"id": "agent_123", "name": "Helper"})
+
+        mock_api(handler)
+        with Client(api_key="ggt_test_key") as client:
+            result = client.agents.create(name="Helper", tools=[])
+
+        assert result == {"id": "agent_123", "name": "Helper"}
+        assert seen[0][0] == "application/json"
+        assert seen[0][1]["name"] == "Helper"
+
+    def test_non_str_keys_are_coerced(self, mock_api):
+        """Non-string dict keys should be encoded as strings, as with stdlib json."""
+
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={})
+
+        mock_api(handler)
+        with Client(api_key="ggt_test_key") as client:
+            client.agents.update("agent_123", metadata={1: "x"})
+
+        assert bodies == [{"metadata": {"1": "x"}}]
+
+    def test_empty_response_body(self, mock_api):
+        """Empty responses such as 204 should not fail to decode."""
+
+        mock_api(lambda r: httpx.Response(204))
+        with Client(api_key="ggt_test_key") as client:
+            assert client.agents.delete("agent_123") is None
+
+
+class TestClientStreaming:
+    """Tests for streaming NDJSON responses."""
+
+    def test_executions_iter_yields_each_line(self, mock_api):
+        """executions.iter should yield one object per NDJSON line."""
+
+        def handler(request):
+            assert request.headers["Accept"] == "application/x-ndjson"
+            return httpx.Response(200, content=b'{"step": 1}\n\n{"step": 2}\n')
+
+        mock_api(handler)
+        with Client(api_key="ggt_test_key") as client:
+            assert list(client.executions.iter("exec_123")) == [{"step": 1}, {"step": 2}]
+
+    def test_stream_maps_errors(self, mock_api):
+        """Streaming errors should raise the usual SDK exceptions."""
+
+        mock_api(lambda r: httpx.Response(404, text="missing"))
+        with Client(api_key="ggt_test_key") as client:
+            with pytest.raises(APIError) as exc_info:
+                list(client.executions.iter("exec_123"))
+        assert exc_info.value.code == 404
+
+    async def test_async_executions_iter(self, mock_api):
+        """AsyncClient should stream NDJSON lines as they arrive."""
+
+        mock_api(lambda r: httpx.Response(200, content=b'{"step": 1}\n{"step": 2}\n'))
+        async with AsyncClient(api_key="ggt_test_key") as client:
+            steps = [step async for step in client.executions.iter("exec_123")]
+        assert steps == [{"step": 1}, {"step": 2}]
+
+    async def test_async_stream_releases_concurrency_slot(self, mock_api):
+        """Abandoning a stream should not keep a max_concurrency slot."""
+
+        def handler(request):
+            if request.headers["Accept"] == "application/x-ndjson":
+                return httpx.Response(200, content=b'{"step": 1}\n{"step": 2}\n')
+            return httpx.Response(200, json={"id": "exec_123"})
+
+        mock_api(handler)
+        async with AsyncClient(api_key="ggt_test_key", max_concurrency=1) as client:
+            steps = client.executions.iter("exec_123")
+            async for _ in steps:
+                break
+            execution = await asyncio.wait_for(client.executions.get("exec_123"), 1)
+            assert execution == {"id": "exec_123"}
+            await steps.aclose()
+
+
+class TestClientErrors:
+    """Tests for HTTP error handling."""
+
+    def test_unauthorized_raises_authentication_error(self, mock_api):
+        """401 responses should raise AuthenticationError."""
+
+        mock_api(lambda r: httpx.Response(401))
+        with Client(api_key="ggt_test_key") as client:
+            with pytest.raises(AuthenticationError):
+                client.agents.list()
+
+    def test_server_error_raises_api_error(self, mock_api):
+        """Other error responses should raise APIError with the status code."""
+
+        mock_api(lambda r: httpx.Response(500, text="boom"))
+        with Client(api_key="ggt_test_key") as client:
+            with pytest.raises(APIError) as exc_info:
+                client.agents.list()
+        assert exc_info.value.code == 500
+
+    def test_rate_limit_raises_with_retry_after(self, monkeypatch, mock_api):
+        """429 responses should raise RateLimitError once retries run out."""
+
+        monkeypatch.setattr("gagiteck.client.time.sleep", lambda s: None)
+        response = httpx.Response(429, headers={"Retry-After": "7"}, text="slow down")
+        mock_api(lambda r: response)
+        with Client(api_key="ggt_test_key", max_retries=0) as client:
+            with pytest.raises(RateLimitError) as exc_info:
+                client.agents.list()
+        assert exc_info.value.retry_after == 7
+
+    def test_rate_limit_is_retried(self, monkeypatch, mock_api):
+        """429 responses should be retried after backing off."""
+
+        delays = []
+        monkeypatch.setattr("gagiteck.client.time.sleep", delays.append)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(429),
+            httpx.Response(200, json={"data": []}),
+        ])
+        mock_api(lambda r: next(responses))
+        with Client(api_key="ggt_test_key") as client:
+            assert client.agents.list() == {"data": []}
+        assert len(delays) == 2
+        assert 2 <= delays[0] < 3
+        assert 2 <= delays[1] < 3
+
+
+class TestAsyncClient:
+    """Tests for the AsyncClient class."""
+
+    def test_async_client_requires_api_key(self):
+        """AsyncClient should require an API key."""
+        with pytest.raises(AuthenticationError):
+            AsyncClient(api_key=None)
+
+    def test_async_client_validates_api_key_format(self):
+        """AsyncClient should validate API key format."""
+        with pytest.raises(AuthenticationError):
+            AsyncClient(api_key="invalid_key")
+
+    async def test_async_client_context_manager(self):
+        """AsyncClient should work as async context manager."""
+        async with AsyncClient(api_key="ggt_test_key") as client:
+            assert client.api_key == "ggt_test_key"
+            assert hasattr(client, "agents")
+            assert hasattr(client, "workflows")
+            assert hasattr(client, "executions")
+
+    async def test_async_client_bounds_concurrency(self, mock_api):
+        """AsyncClient should not exceed max_concurrency in-flight requests."""
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"ok": True})
+
+        mock_api(handler)
+        async with AsyncClient(api_key="ggt_test_key", max_concurrency=3) as client:
+            results = await asyncio.gather(
+                *(client.agents.run("agent_123", f"msg {i}") for i in range(10))
+            )
+
+        assert len(results) == 10
+        assert peak == 3
+
+    async def test_async_rate_limit_is_retried(self, monkeypatch, mock_api):
+        """AsyncClient should retry 429s and release its slot while backing off."""
+
+        attempts = {}
+
+        def handler(request):
+            path = request.url.path
+            attempts[path] = attempts.get(path, 0) + 1
+            if attempts[path] == 1:
+                return httpx.Response(429, headers={"Retry-After": "2"})
+            return httpx.Response(200, json={"path": path})
+
+        retry_afters = []
+
+        def no_delay(error, attempt):
+            retry_afters.append(error.retry_after)
+            return 0
+
+        monkeypatch.setattr("gagiteck.client._retry_delay", no_delay)
+        mock_api(handler)
+        async with AsyncClient(api_key="ggt_test_key", max_concurrency=1) as client:
+            results = await asyncio.wait_for(
+                asyncio.gather(client.agents.get("a"), client.agents.get("b")), 1
+            )
+
+        assert [r["path"] for r in results] == ["/v1/agents/a", "/v1/agents/b"]
+        assert retry_afters == [2, 2]
+        assert client._semaphore._value == 1
+
+
+class TestPackageImport:
+    """Tests for package-level imports."""
+
+    def test_import_does_not_load_httpx(self):
+        """Importing the package should not import httpx until Client is used."""
+
+        code = (
+            "import sys, gagiteck; "
+            "assert 'httpx' not in sys.modules; "
+            "gagiteck.Agent; "
+            "assert 'httpx' not in sys.modules; "
+            "gagiteck.Client; "
+            "assert 'httpx' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        """Unknown attributes should raise AttributeError."""
+        import gagiteck
+
+        with pytest.raises(AttributeError):
+            gagiteck.DoesNotExist
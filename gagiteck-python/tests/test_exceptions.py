@@ -0,0 +1,27 @@
+"""Tests for SDK exceptions."""
+
+from gagiteck import APIError, RateLimitError
+from gagiteck.exceptions import ToolError
+
+
+class TestExceptions:
+    """Tests for exception formatting."""
+
+    def test_api_error_str(self):
+        """APIError should keep the raw message and format on str()."""
+        error = APIError(code=500, message="boom")
+        assert error.code == 500
+        assert error.message == "boom"
+        assert str(error) == "API Error 500: boom"
+
+    def test_rate_limit_error_str(self):
+        """RateLimitError should format like an APIError with code 429."""
+        error = RateLimitError("slow down", retry_after=5)
+        assert error.retry_after == 5
+        assert str(error) == "API Error 429: slow down"
+
+    def test_tool_error_str(self):
+        """ToolError should include the tool name."""
+        error = ToolError("search", "timed out")
+        assert error.tool_name == "search"
+        assert str(error) == "Tool 'search' failed: timed out"
@@ -0,0 +1,55 @@
+"""Tests for tool definitions."""
+
+from gagiteck import Tool, tool
+
+
+class TestTool:
+    """Tests for the Tool class."""
+
+    def test_from_function_builds_schema(self):
+        """Type hints and defaults should drive the parameter schema."""
+
+        def add(a: int, b: float = 1.0, label: str = "") -> float:
+            """Add two numbers."""
+            return a + b
+
+        t = Tool.from_function(add)
+        assert t.name == "add"
+        assert t.description == "Add two numbers."
+        assert t.parameters["properties"]["a"]["type"] == "integer"
+        assert t.parameters["properties"]["b"]["type"] == "number"
+        assert t.parameters["required"] == ["a"]
+
+    def test_from_function_is_cached(self):
+        """Converting the same function twice should reuse the schema, not the Tool."""
+
+        def ping() -> str:
+            """Ping."""
+            return "pong"
+
+        first = Tool.from_function(ping)
+        second = Tool.from_function(ping)
+        assert first == second
+        assert first is not second
+        assert first.parameters is not second.parameters
+
+    def test_to_dict_is_cached(self):
+        """to_dict should return the same object until a field changes."""
+        t = Tool(name="noop", description="Do nothing")
+        first = t.to_dict()
+        assert id(t.to_dict()) == id(first)
+
+        t.description = "Still nothing"
+        assert t.to_dict() is not first
+        assert t.to_dict()["function"]["description"] == "Still nothing"
+
+    def test_tool_decorator(self):
+        """The decorator should produce a callable Tool."""
+
+        @tool
+        def echo(text: str) -> str:
+            """Echo text."""
+            return text
+
+        assert isinstance(echo, Tool)
+        assert echo(text="hi") == "hi"